@@ -0,0 +1,74 @@
+# benchmarks/regression.py
+import json
+from pathlib import Path
+
+MIB = 2**20
+METRICS = ("total_s", "peak_mem_bytes")
+
+
+def load_results(path):
+    """Load a list of per-size results written by `run_pipeline --json`."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare_to_baseline(results, baseline, max_regression_pct=20.0, min_time_s=0.01, min_mem_bytes=MIB):
+    """
+    Compare per-span `total_s` and `peak_mem_bytes` against a saved run, matching
+    runs by row count. Baseline values under `min_time_s` / `min_mem_bytes` are
+    ignored as too noisy to compare.
+
+    Returns a dict describing both the regressions and everything that could
+    not be compared:
+      regressions       -- human-readable messages for metrics over the limit
+      compared          -- number of (rows, span, metric) checks actually made
+      unmatched_rows    -- row counts with no baseline run
+      settings_mismatch -- (rows, {setting: (baseline, current)}) for runs whose
+                           settings differ; such runs are not compared
+      unmatched_spans   -- (rows, span) present on only one side
+      skipped_metrics   -- (rows, span, metric) missing on one side (e.g. no --memory)
+    """
+    limit = 1 + max_regression_pct / 100
+    floors = {"total_s": min_time_s, "peak_mem_bytes": min_mem_bytes}
+    formats = {"total_s": "{:.4f}s", "peak_mem_bytes": "{:.0f} bytes"}
+    base_by_rows = {r["rows"]: r for r in baseline}
+    report = {
+        "regressions": [], "compared": 0, "unmatched_rows": [],
+        "settings_mismatch": [], "unmatched_spans": [], "skipped_metrics": [],
+    }
+    for result in results:
+        rows = result["rows"]
+        base = base_by_rows.get(rows)
+        if base is None:
+            report["unmatched_rows"].append(rows)
+            continue
+        settings, base_settings = result.get("settings", {}), base.get("settings", {})
+        if settings != base_settings:
+            diff = {
+                k: (base_settings.get(k), settings.get(k))
+                for k in sorted(set(settings) | set(base_settings))
+                if base_settings.get(k) != settings.get(k)
+            }
+            report["settings_mismatch"].append((rows, diff))
+            continue
+        for name in sorted(set(result["spans"]) ^ set(base["spans"])):
+            report["unmatched_spans"].append((rows, name))
+        for name, s in result["spans"].items():
+            b = base["spans"].get(name)
+            if b is None:
+                continue
+            for key in METRICS:
+                old, new = b.get(key), s.get(key)
+                if old is None or new is None:
+                    if old is not None or new is not None:
+                        report["skipped_metrics"].append((rows, name, key))
+                    continue
+                if old < floors[key]:
+                    continue
+                report["compared"] += 1
+                if new > old * limit:
+                    pct = (new / old - 1) * 100
+                    fmt = formats[key]
+                    report["regressions"].append(
+                        f"{rows:,} rows: {name} {key} {fmt.format(old)} -> {fmt.format(new)} (+{pct:.1f}%)"
+                    )
+    return report
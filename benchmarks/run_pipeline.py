@@ -0,0 +1,183 @@
+# benchmarks/run_pipeline.py
+"""
+End-to-end FinWise pipeline benchmark.
+
+    python -m benchmarks.run_pipeline --rows 10000 100000 1000000 --json bench.json
+    python -m benchmarks.run_pipeline --rows 10000 100000 --baseline bench.json --max-regression 20
+
+Stages: load_transactions_from_csv -> normalize_and_categorize -> utils/analysis
+-> ingest_folder / ingest_transactions (embed_texts) -> SimpleRAG.query -> ask_llm.
+The LLM is always stubbed; embeddings use a hashing stub unless --embedder model.
+Everything runs inside a temp directory so the repo's index files are untouched.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.regression import compare_to_baseline, load_results
+from benchmarks.stubs import HashingEmbedder, StubLLMClient
+from benchmarks.synthetic import DEFAULT_SEED, make_corpus, write_transactions_csv
+from utils import instrumentation
+from utils.analysis import category_breakdown, monthly_spend, top_merchants
+from utils.llm_agent import ask_llm
+from utils.preprocessing import load_transactions_from_csv, normalize_and_categorize
+from utils.rag_setup import SimpleRAG
+
+QUERIES = [
+    "What were my biggest expenses last month?",
+    "How much did I spend on transport?",
+    "Summarize my entertainment spending.",
+    "What does the GFR say about financial accountability?",
+    "Explain the audit procedure for government accounts.",
+]
+
+# CLI options that describe how results are compared or stored, not the run itself.
+_NON_SETTINGS = {"rows", "json", "baseline", "max_regression", "min_time"}
+
+
+def positive_int(value):
+    n = int(value)
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return n
+
+
+def run_settings(args):
+    """The options that affect benchmark numbers, stored with each result."""
+    return {k: v for k, v in vars(args).items() if k not in _NON_SETTINGS}
+
+
+def run_once(n_rows, workdir, args):
+    """Run the full pipeline for `n_rows` transactions and return its metrics."""
+    instrumentation.reset()
+    wall_start = time.perf_counter()
+
+    csv_path = write_transactions_csv(Path(workdir) / f"tx_{n_rows}.csv", n_rows, seed=args.seed, layout=args.layout)
+    corpus_dir = Path(workdir) / "corpus"
+    make_corpus(corpus_dir, args.docs, seed=args.seed)
+
+    with instrumentation.span("pipeline.total"):
+        df = load_transactions_from_csv(csv_path)
+        df = normalize_and_categorize(df)
+        monthly_spend(df)
+        category_breakdown(df)
+        top_merchants(df, 10)
+
+        model = HashingEmbedder() if args.embedder == "hash" else None
+        rag = SimpleRAG(model=model)
+        rag.create_index()
+        rag.ingest_folder(corpus_dir)
+        rag.ingest_transactions(df.head(args.rag_rows))
+
+        client = StubLLMClient(latency_s=args.llm_latency)
+        for q in QUERIES[:args.queries]:
+            results = rag.query(q, top_k=5)
+            context = "\n\n".join(r["text"] for r in results)
+            ask_llm(q, context, client=client)
+
+    snap = instrumentation.snapshot()
+    snap["rows"] = n_rows
+    snap["settings"] = run_settings(args)
+    snap["wall_s"] = time.perf_counter() - wall_start
+    for name in ("vector_index.faiss", "index_meta.pkl"):
+        p = Path(workdir) / name
+        if p.exists():
+            p.unlink()
+    return snap
+
+
+def print_summary(result):
+    print(f"\n== {result['rows']:,} rows (wall {result['wall_s']:.2f}s) ==")
+    for name, s in sorted(result["spans"].items(), key=lambda kv: -kv[1]["total_s"]):
+        mem = s["peak_mem_bytes"]
+        mem_str = f"  peak {mem / 2**20:8.1f} MiB" if mem is not None else ""
+        print(f"  {name:<45} {s['calls']:>5}x  total {s['total_s']:9.4f}s  mean {s['mean_s']:9.5f}s{mem_str}")
+    for name, v in sorted(result["counters"].items()):
+        print(f"  # {name:<43} {v:,}")
+
+
+def check_baseline(report, args):
+    """Print a comparison report; return False if it found regressions or compared nothing usable."""
+    ok = True
+    if report["unmatched_rows"]:
+        sizes = ", ".join(f"{r:,}" for r in report["unmatched_rows"])
+        print(f"\nERROR: no baseline run in {args.baseline} for rows: {sizes}")
+        ok = False
+    for rows, diff in report["settings_mismatch"]:
+        changes = ", ".join(f"{k}: {old!r} -> {new!r}" for k, (old, new) in diff.items())
+        print(f"\nERROR: {rows:,} rows: settings differ from baseline ({changes})")
+        ok = False
+    for rows, name in report["unmatched_spans"]:
+        print(f"WARNING: {rows:,} rows: span {name} present in only one of baseline/current")
+    for rows, name, key in report["skipped_metrics"]:
+        print(f"WARNING: {rows:,} rows: {name} {key} missing in baseline or current run, not compared")
+    if report["compared"] == 0:
+        print(f"\nERROR: nothing was compared against {args.baseline}")
+        ok = False
+    if report["regressions"]:
+        print(f"\n{len(report['regressions'])} regression(s) over {args.max_regression:g}% vs {args.baseline}:")
+        for msg in report["regressions"]:
+            print(f"  {msg}")
+        ok = False
+    if ok:
+        print(f"\nNo regressions over {args.max_regression:g}% vs {args.baseline} "
+              f"({report['compared']} metrics compared).")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the FinWise pipeline on synthetic data.")
+    parser.add_argument("--rows", type=positive_int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="transaction counts to benchmark (e.g. 10000 ... 10000000)")
+    parser.add_argument("--layout", choices=["amount", "debit_credit"], default="amount")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--docs", type=int, default=50, help="synthetic corpus documents to ingest")
+    parser.add_argument("--rag-rows", type=int, default=10_000,
+                        help="cap on transactions passed to ingest_transactions")
+    parser.add_argument("--queries", type=int, default=len(QUERIES))
+    parser.add_argument("--embedder", choices=["hash", "model"], default="hash",
+                        help="'model' loads the real sentence transformer")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="simulated LLM latency in seconds")
+    parser.add_argument("--memory", action="store_true", help="sample peak memory per stage (slower)")
+    parser.add_argument("--json", type=Path, help="write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="JSON from a previous --json run to compare against")
+    parser.add_argument("--max-regression", type=float, default=20.0,
+                        help="allowed %% increase in a span's total_s / peak_mem_bytes over the baseline")
+    parser.add_argument("--min-time", type=float, default=0.01,
+                        help="ignore spans whose baseline total_s is below this many seconds")
+    args = parser.parse_args(argv)
+    baseline = load_results(args.baseline) if args.baseline else None
+
+    instrumentation.enable(memory=args.memory)
+    results = []
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory(prefix="finwise-bench-") as workdir:
+            # SimpleRAG reads/writes its index relative to the cwd.
+            os.chdir(workdir)
+            for n in args.rows:
+                result = run_once(n, workdir, args)
+                print_summary(result)
+                results.append(result)
+            os.chdir(cwd)
+    finally:
+        os.chdir(cwd)
+        instrumentation.disable()
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nWrote {args.json}")
+
+    if baseline is not None:
+        report = compare_to_baseline(results, baseline, args.max_regression, args.min_time)
+        if not check_baseline(report, args):
+            sys.exit(1)
+    return results
+
+
+if __name__ == "__main__":
+    main()
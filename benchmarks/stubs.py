@@ -0,0 +1,42 @@
+# benchmarks/stubs.py
+import hashlib
+import re
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from utils.rag_setup import EMB_DIM
+
+
+class HashingEmbedder:
+    """
+    Deterministic stand-in for SentenceTransformer: hashes tokens into a
+    fixed-size bag-of-words vector. Mirrors the `encode` signature used by SimpleRAG.
+    """
+    def __init__(self, dim=EMB_DIM):
+        self.dim = dim
+
+    def encode(self, texts, convert_to_numpy=True, show_progress_bar=False):
+        out = np.zeros((len(texts), self.dim), dtype="float32")
+        for i, t in enumerate(texts):
+            for tok in re.findall(r"\w+", t.lower()):
+                h = int.from_bytes(hashlib.blake2b(tok.encode(), digest_size=8).digest(), "little")
+                out[i, h % self.dim] += 1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+
+class StubLLMClient:
+    """Offline stand-in for the OpenAI client with a fixed, optional latency."""
+    def __init__(self, latency_s=0.0):
+        self.latency_s = latency_s
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model, messages, temperature=0.3):
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        prompt = messages[-1]["content"]
+        answer = f"Based on available information, this is a stub answer ({len(prompt)} prompt chars)."
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=answer))])
@@ -0,0 +1,112 @@
+# benchmarks/synthetic.py
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SEED = 42
+SEED_DOCS_DIR = Path(__file__).resolve().parent.parent / "data" / "seed_docs"
+
+# Descriptions cover every branch of normalize_and_categorize plus "Other".
+MERCHANTS = [
+    ("Salary from ACME", "income", 1),
+    ("Interest Deposit", "income", 1),
+    ("Uber Ride", "transport", -1),
+    ("Ola Cab", "transport", -1),
+    ("Metro Train Card", "transport", -1),
+    ("Supermarket ABC", "grocery", -1),
+    ("Fresh Mart", "grocery", -1),
+    ("Corner Store", "grocery", -1),
+    ("Restaurant XYZ", "dining", -1),
+    ("Cafe Mocha", "dining", -1),
+    ("Netflix Subscription", "entertainment", -1),
+    ("Amazon Purchase", "entertainment", -1),
+    ("Electricity Bill", "utilities", -1),
+    ("Mobile Recharge", "utilities", -1),
+    ("Rent Payment", "rent", -1),
+    ("ATM Withdrawal", "cash", -1),
+]
+
+
+def make_transactions(n_rows, seed=DEFAULT_SEED, layout="amount", start="2023-01-01", days=730):
+    """
+    Build a synthetic transaction DataFrame shaped like data/sample_transactions.csv.
+    layout="amount" emits a signed Amount column; layout="debit_credit" emits
+    separate Debit/Credit columns to exercise the other preprocessing branch.
+    """
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(MERCHANTS), size=n_rows)
+    names = np.array([m[0] for m in MERCHANTS], dtype=object)
+    cats = np.array([m[1] for m in MERCHANTS], dtype=object)
+    signs = np.array([m[2] for m in MERCHANTS])
+
+    magnitude = np.round(rng.lognormal(mean=4.0, sigma=1.0, size=n_rows), 2)
+    magnitude[signs[idx] > 0] *= 20
+    amount = magnitude * signs[idx]
+
+    dates = pd.Timestamp(start) + pd.to_timedelta(rng.integers(0, days, size=n_rows), unit="D")
+    df = pd.DataFrame({
+        "Date": dates.strftime("%Y-%m-%d"),
+        "TransactionID": np.char.add("TXN", np.arange(1, n_rows + 1).astype(str)),
+        "Account": "Checking",
+        "Type": np.where(amount > 0, "Credit", "Debit"),
+        "Description": names[idx],
+        "Category": cats[idx],
+        "Currency": "INR",
+    })
+    if layout == "debit_credit":
+        df["Debit"] = np.where(amount < 0, -amount, 0.0)
+        df["Credit"] = np.where(amount > 0, amount, 0.0)
+    elif layout == "amount":
+        df["Amount"] = amount
+    else:
+        raise ValueError(f"Unknown layout: {layout!r}")
+    return df
+
+
+def write_transactions_csv(path, n_rows, seed=DEFAULT_SEED, layout="amount", chunk_rows=1_000_000):
+    """
+    Write a synthetic transactions CSV in chunks so multi-million row files
+    don't need to be materialised as one DataFrame. Returns the path.
+    """
+    path = Path(path)
+    written = 0
+    chunk_seed = seed
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        while written < n_rows:
+            n = min(chunk_rows, n_rows - written)
+            chunk = make_transactions(n, seed=chunk_seed, layout=layout)
+            chunk["TransactionID"] = np.char.add("TXN", np.arange(written + 1, written + n + 1).astype(str))
+            chunk.to_csv(f, index=False, header=(written == 0))
+            written += n
+            chunk_seed += 1
+    return path
+
+
+def _seed_sentences(seed_dir=SEED_DOCS_DIR):
+    sentences = []
+    for p in sorted(Path(seed_dir).glob("*.txt")):
+        text = re.sub(r"\s+", " ", p.read_text(encoding="utf-8", errors="ignore")).strip()
+        sentences.extend(s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip())
+    if not sentences:
+        raise FileNotFoundError(f"No seed documents found in {seed_dir}")
+    return sentences
+
+
+def make_corpus(out_dir, n_docs, sentences_per_doc=40, seed=DEFAULT_SEED, seed_dir=SEED_DOCS_DIR):
+    """
+    Write `n_docs` .txt files into `out_dir`, each a random resampling of
+    sentences from the seed documents. Returns the list of written paths.
+    """
+    rng = np.random.default_rng(seed)
+    sentences = _seed_sentences(seed_dir)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(n_docs):
+        picks = rng.integers(0, len(sentences), size=sentences_per_doc)
+        p = out / f"synthetic_doc_{i:05d}.txt"
+        p.write_text(" ".join(sentences[j] for j in picks), encoding="utf-8")
+        paths.append(p)
+    return paths
@@ -5,12 +5,14 @@ from utils.preprocessing import load_transactions_from_csv, normalize_and_catego
 from utils.analysis import monthly_spend, category_breakdown, top_merchants
 from utils.plotly_charts import monthly_spend_figure, category_pie, top_merchants_bar
 from utils.rag_setup import get_rag_index
+from utils.instrumentation import bind_session, render_debug_panel
 import pandas as pd
 from pathlib import Path
 
 
 # ---------------- Page Config ----------------
 st.set_page_config(page_title="Dashboard — FinWise", layout="wide")
+bind_session()
 
 # ---------------- Session Validation ----------------
 token = st.session_state.get("token")
@@ -94,3 +96,4 @@ if "df" in st.session_state:
 else:
     st.info("📈 Upload or load sample data to view analytics.")
 
+render_debug_panel()
@@ -2,8 +2,10 @@
 import streamlit as st
 from utils.rag_setup import get_rag_index
 from utils.llm_agent import ask_llm
+from utils.instrumentation import bind_session, render_debug_panel
 
 st.set_page_config(page_title="FinWise Chatbot", layout="wide")
+bind_session()
 
 st.title("💬 FinWise Financial Assistant")
 
@@ -31,3 +33,5 @@ if st.button("Get Answer") and query.strip():
             st.markdown("**Sources Used:**")
             for s in sources:
                 st.markdown(f"- {s}")
+
+render_debug_panel()
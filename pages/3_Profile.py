@@ -2,10 +2,12 @@
 import streamlit as st
 from utils.session_manager import validate_session, get_user
 from utils.analysis import monthly_spend, category_breakdown
+from utils.instrumentation import bind_session, render_debug_panel
 import pandas as pd
 import plotly.graph_objects as go
 
 st.set_page_config(page_title="Profile — FinWise", layout="wide")
+bind_session()
 
 # -------------------------------------------------------------
 # 🧾 Authentication
@@ -114,3 +116,5 @@ else:
         "Amount (₹)": [f"{income:,.2f}", f"{abs(expense):,.2f}", f"{netflow:,.2f}"]
     })
     st.table(summary_df)
+
+render_debug_panel()
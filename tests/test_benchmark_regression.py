@@ -0,0 +1,57 @@
+from benchmarks.regression import MIB, compare_to_baseline
+
+SETTINGS = {"seed": 42, "layout": "amount", "memory": False}
+
+
+def _run(rows, total_s, peak=None, settings=SETTINGS, span="rag.query"):
+    return {
+        "rows": rows, "settings": dict(settings),
+        "spans": {span: {"total_s": total_s, "peak_mem_bytes": peak}},
+    }
+
+
+def test_within_limit_passes():
+    report = compare_to_baseline([_run(1000, 1.1)], [_run(1000, 1.0)], max_regression_pct=20)
+    assert report["regressions"] == []
+    assert report["compared"] == 1
+
+
+def test_time_regression_reported():
+    report = compare_to_baseline([_run(1000, 1.5)], [_run(1000, 1.0)], max_regression_pct=20)
+    assert len(report["regressions"]) == 1
+    assert "rag.query total_s" in report["regressions"][0]
+
+
+def test_memory_regression_reported():
+    report = compare_to_baseline([_run(1000, 1.0, 30 * MIB)], [_run(1000, 1.0, 10 * MIB)])
+    assert len(report["regressions"]) == 1
+    assert "peak_mem_bytes" in report["regressions"][0]
+
+
+def test_noise_floor_not_counted_as_compared():
+    report = compare_to_baseline([_run(1000, 0.005)], [_run(1000, 0.001)], min_time_s=0.01)
+    assert report["regressions"] == []
+    assert report["compared"] == 0
+
+
+def test_missing_baseline_rows_reported():
+    report = compare_to_baseline([_run(2000, 9.0)], [_run(1000, 1.0)])
+    assert report["unmatched_rows"] == [2000]
+    assert report["compared"] == 0
+
+
+def test_settings_mismatch_refused():
+    current = _run(1000, 9.0, settings=dict(SETTINGS, layout="debit_credit"))
+    report = compare_to_baseline([current], [_run(1000, 1.0)])
+    assert report["settings_mismatch"] == [(1000, {"layout": ("amount", "debit_credit")})]
+    assert report["regressions"] == []
+    assert report["compared"] == 0
+
+
+def test_missing_memory_and_spans_reported():
+    base = _run(1000, 1.0, 10 * MIB)
+    base["spans"]["rag.save"] = {"total_s": 1.0, "peak_mem_bytes": None}
+    report = compare_to_baseline([_run(1000, 1.0)], [base])
+    assert report["skipped_metrics"] == [(1000, "rag.query", "peak_mem_bytes")]
+    assert report["unmatched_spans"] == [(1000, "rag.save")]
+    assert report["compared"] == 1
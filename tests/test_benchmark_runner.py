@@ -0,0 +1,22 @@
+import pytest
+
+for _mod in ("pandas", "faiss", "streamlit", "sentence_transformers", "pdfplumber", "openai", "dotenv"):
+    pytest.importorskip(_mod)
+
+from benchmarks.run_pipeline import main
+
+
+def test_main_runs_end_to_end(tmp_path):
+    out = tmp_path / "bench.json"
+    results = main(["--rows", "200", "--docs", "2", "--queries", "1", "--json", str(out)])
+    assert [r["rows"] for r in results] == [200]
+    assert results[0]["counters"]["preprocessing.rows_loaded"] == 200
+    assert results[0]["counters"]["llm.calls"] == 1
+    assert results[0]["settings"]["docs"] == 2
+    assert out.exists()
+
+
+@pytest.mark.parametrize("rows", ["0", "-5"])
+def test_rows_must_be_positive(rows):
+    with pytest.raises(SystemExit):
+        main(["--rows", rows])
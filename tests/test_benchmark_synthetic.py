@@ -0,0 +1,36 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from benchmarks.synthetic import make_corpus, make_transactions, write_transactions_csv
+
+
+@pytest.mark.parametrize("layout", ["amount", "debit_credit"])
+def test_make_transactions_is_deterministic(layout):
+    a = make_transactions(500, seed=7, layout=layout)
+    b = make_transactions(500, seed=7, layout=layout)
+    pd.testing.assert_frame_equal(a, b)
+    assert len(a) == 500
+    assert not a.equals(make_transactions(500, seed=8, layout=layout))
+
+
+def test_make_transactions_rejects_unknown_layout():
+    with pytest.raises(ValueError):
+        make_transactions(10, layout="nope")
+
+
+def test_chunked_csv_reads_back_as_one_table(tmp_path):
+    path = write_transactions_csv(tmp_path / "tx.csv", 25, chunk_rows=10)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert sum(line.startswith("Date,") for line in lines) == 1
+    df = pd.read_csv(path)
+    assert len(df) == 25
+    assert df["TransactionID"].is_unique
+    assert list(df["TransactionID"][:2]) == ["TXN1", "TXN2"]
+
+
+def test_make_corpus_writes_n_docs(tmp_path):
+    paths = make_corpus(tmp_path / "corpus", 3, sentences_per_doc=5)
+    assert len(paths) == 3
+    assert sorted(p.name for p in (tmp_path / "corpus").iterdir()) == sorted(p.name for p in paths)
+    assert all(p.read_text(encoding="utf-8") for p in paths)
@@ -0,0 +1,157 @@
+import json
+import threading
+import tracemalloc
+
+import pytest
+
+from utils import instrumentation as ins
+
+MB = 2**20
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    ins.disable()
+    ins.use_collector(None)
+    ins.reset()
+    yield
+    ins.disable()
+    ins.use_collector(None)
+    ins.reset()
+
+
+def test_nothing_recorded_while_disabled():
+    with ins.span("a"):
+        pass
+    ins.timed("b")(lambda: None)()
+    ins.count("c")
+    snap = ins.snapshot()
+    assert snap["spans"] == {}
+    assert snap["counters"] == {}
+
+
+def test_repeated_span_counts_min_max():
+    ins.enable()
+    for _ in range(3):
+        with ins.span("stage"):
+            pass
+    s = ins.snapshot()["spans"]["stage"]
+    assert s["calls"] == 3
+    assert s["min_s"] <= s["mean_s"] <= s["max_s"]
+    assert s["total_s"] == pytest.approx(s["mean_s"] * 3)
+    assert s["peak_mem_bytes"] is None
+
+
+def test_timed_preserves_result_and_name():
+    ins.enable()
+
+    @ins.timed("stage.fn")
+    def fn(x):
+        return x * 2
+
+    assert fn(21) == 42
+    assert fn.__name__ == "fn"
+    assert ins.snapshot()["spans"]["stage.fn"]["calls"] == 1
+
+
+def test_counters():
+    ins.enable()
+    ins.count("rag.queries")
+    ins.count("rag.queries")
+    ins.count("preprocessing.rows_loaded", 500)
+    assert ins.snapshot()["counters"] == {"rag.queries": 2, "preprocessing.rows_loaded": 500}
+
+
+def test_parent_peak_includes_memory_used_before_child():
+    ins.enable(memory=True)
+    with ins.span("parent"):
+        buf = bytearray(20 * MB)
+        del buf
+        with ins.span("child"):
+            small = bytearray(1024)
+            del small
+    spans = ins.snapshot()["spans"]
+    assert spans["parent"]["peak_mem_bytes"] >= 20 * MB
+    assert spans["parent"]["peak_mem_bytes"] >= spans["child"]["peak_mem_bytes"]
+    assert spans["child"]["peak_mem_bytes"] < MB
+
+
+def test_parent_peak_includes_child_peak():
+    ins.enable(memory=True)
+    with ins.span("parent"):
+        with ins.span("child"):
+            buf = bytearray(10 * MB)
+            del buf
+    spans = ins.snapshot()["spans"]
+    assert spans["child"]["peak_mem_bytes"] >= 10 * MB
+    assert spans["parent"]["peak_mem_bytes"] >= spans["child"]["peak_mem_bytes"]
+
+
+def test_peak_is_relative_to_span_start():
+    ins.enable(memory=True)
+    held = bytearray(20 * MB)
+    with ins.span("noop"):
+        z = 1
+    assert ins.snapshot()["spans"]["noop"]["peak_mem_bytes"] < MB
+    del held, z
+
+
+def test_overlapping_threads_skip_memory_samples():
+    ins.enable(memory=True)
+    inside, release = threading.Event(), threading.Event()
+
+    def worker():
+        with ins.span("worker"):
+            inside.set()
+            release.wait(5)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    inside.wait(5)
+    with ins.span("main"):
+        pass
+    release.set()
+    t.join()
+    spans = ins.snapshot()["spans"]
+    assert spans["main"]["peak_mem_bytes"] is None
+    assert spans["main"]["mem_samples_skipped"] == 1
+    assert spans["worker"]["mem_samples_skipped"] == 1
+
+
+def test_collectors_are_isolated():
+    ins.enable()
+    mine = ins.Collector()
+    ins.use_collector(mine)
+    with ins.span("session.a"):
+        pass
+    ins.use_collector(None)
+    assert "session.a" in mine.snapshot()["spans"]
+    assert ins.snapshot()["spans"] == {}
+
+
+def test_disable_leaves_foreign_tracemalloc_running():
+    tracemalloc.start()
+    try:
+        ins.enable(memory=True)
+        ins.disable()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_disable_stops_tracemalloc_it_started():
+    assert not tracemalloc.is_tracing()
+    ins.enable(memory=True)
+    ins.disable()
+    assert not tracemalloc.is_tracing()
+
+
+def test_to_json_round_trip(tmp_path):
+    ins.enable()
+    with ins.span("stage"):
+        pass
+    ins.count("stage.items", 3)
+    path = tmp_path / "metrics.json"
+    data = ins.to_json(path)
+    assert json.loads(data) == ins.snapshot()
+    assert json.loads(path.read_text(encoding="utf-8")) == json.loads(data)
@@ -1,12 +1,18 @@
 # utils/analysis.py
+from utils.instrumentation import timed
+
+
+@timed("analysis.monthly_spend")
 def monthly_spend(df):
     df = df.copy()
     df['ym'] = df['Date'].dt.to_period('M')
     m = df.groupby('ym')['Amount'].sum().sort_index()
     return m
 
+@timed("analysis.category_breakdown")
 def category_breakdown(df):
     return df.groupby('Category')['Amount'].sum().sort_values(ascending=False)
 
+@timed("analysis.top_merchants")
 def top_merchants(df, n=10):
     return df.groupby('Description')['Amount'].sum().nlargest(n)
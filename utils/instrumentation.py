@@ -0,0 +1,270 @@
+# utils/instrumentation.py
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Opt-in: FINWISE_INSTRUMENT=1 records timings and counters,
+# FINWISE_INSTRUMENT=memory additionally samples peak memory per stage.
+_ENV_VALUE = os.getenv("FINWISE_INSTRUMENT", "").strip().lower()
+
+_enabled = _ENV_VALUE not in ("", "0", "false", "off")
+_trace_memory = _ENV_VALUE == "memory"
+_owns_tracemalloc = False
+
+_local = threading.local()
+
+# tracemalloc's peak is process-wide, so peaks are best-effort. A sample is
+# skipped when another thread entered a span while it ran (`_mem_epoch` bumps on
+# every such overlap), but allocations from threads outside any span (Streamlit
+# server threads, other sessions' unwrapped code) still count towards it.
+_mem_lock = threading.Lock()
+_mem_threads = set()
+_mem_epoch = 0
+
+
+class Collector:
+    """Holds spans and counters for one consumer (a Streamlit session, a benchmark run...)."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans = {}
+        self.counters = {}
+
+    def reset(self):
+        with self.lock:
+            self.spans.clear()
+            self.counters.clear()
+
+    def record(self, name, elapsed, peak=None, mem_skipped=False):
+        with self.lock:
+            s = self.spans.get(name)
+            if s is None:
+                s = self.spans[name] = {
+                    "calls": 0, "total_s": 0.0, "min_s": elapsed, "max_s": elapsed,
+                    "last_s": elapsed, "peak_mem_bytes": None, "mem_samples_skipped": 0,
+                }
+            s["calls"] += 1
+            s["total_s"] += elapsed
+            s["min_s"] = min(s["min_s"], elapsed)
+            s["max_s"] = max(s["max_s"], elapsed)
+            s["last_s"] = elapsed
+            if peak is not None:
+                s["peak_mem_bytes"] = max(s["peak_mem_bytes"] or 0, peak)
+            if mem_skipped:
+                s["mem_samples_skipped"] += 1
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self):
+        with self.lock:
+            spans = {}
+            for name, s in self.spans.items():
+                spans[name] = dict(s, mean_s=s["total_s"] / s["calls"])
+            return {
+                "enabled": _enabled,
+                "memory": _trace_memory,
+                "spans": spans,
+                "counters": dict(self.counters),
+            }
+
+
+# Used when no collector is bound to the current thread (CLI, benchmarks).
+DEFAULT_COLLECTOR = Collector()
+
+
+def use_collector(collector):
+    """Route spans/counters recorded on the current thread to `collector` (None = default)."""
+    _local.collector = collector
+
+
+def current_collector():
+    return getattr(_local, "collector", None) or DEFAULT_COLLECTOR
+
+
+def enable(memory=False):
+    """Turn instrumentation on. With memory=True, peak memory is sampled via tracemalloc."""
+    global _enabled, _trace_memory
+    _enabled = True
+    _trace_memory = memory
+    if memory:
+        _start_tracemalloc()
+
+
+def disable():
+    """Turn instrumentation off, stopping tracemalloc only if this module started it."""
+    global _enabled, _trace_memory, _owns_tracemalloc
+    _enabled = False
+    _trace_memory = False
+    if _owns_tracemalloc and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _owns_tracemalloc = False
+
+
+def _start_tracemalloc():
+    global _owns_tracemalloc
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _owns_tracemalloc = True
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Drop spans and counters of the current collector."""
+    current_collector().reset()
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _enter_memory():
+    global _mem_epoch
+    tid = threading.get_ident()
+    _local.mem_depth = getattr(_local, "mem_depth", 0) + 1
+    with _mem_lock:
+        _mem_threads.add(tid)
+        if len(_mem_threads) > 1:
+            # Another thread is mid-span: invalidate its samples and this one.
+            _mem_epoch += 1
+            return None
+        return _mem_epoch
+
+
+def _exit_memory(epoch):
+    """Return True if no other thread overlapped the span started at `epoch`."""
+    _local.mem_depth -= 1
+    with _mem_lock:
+        reliable = epoch == _mem_epoch and len(_mem_threads) == 1
+        if _local.mem_depth == 0:
+            _mem_threads.discard(threading.get_ident())
+        return reliable
+
+
+@contextmanager
+def span(name):
+    """
+    Time a block of code under `name`. With memory sampling on, the recorded
+    peak is the most memory the block held above what was in use when it began;
+    a parent's peak includes its children. No-op when instrumentation is disabled.
+    """
+    if not _enabled:
+        yield
+        return
+
+    collector = current_collector()
+    stack = _stack()
+    trace = _trace_memory
+    frame = {"peak": 0, "baseline": 0, "epoch": None}
+    if trace:
+        _start_tracemalloc()
+        frame["epoch"] = _enter_memory()
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            # Keep the parent's peak so far before the reset discards it.
+            stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+        frame["baseline"] = current
+    stack.append(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        peak = None
+        mem_skipped = False
+        if trace and tracemalloc.is_tracing():
+            abs_peak = max(tracemalloc.get_traced_memory()[1], frame["peak"])
+            if stack:
+                stack[-1]["peak"] = max(stack[-1]["peak"], abs_peak)
+            if _exit_memory(frame["epoch"]):
+                peak = max(abs_peak - frame["baseline"], 0)
+            else:
+                mem_skipped = True
+        elif trace:
+            _exit_memory(frame["epoch"])
+        collector.record(name, elapsed, peak, mem_skipped)
+
+
+def timed(name):
+    """Decorator form of `span`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    """Increment counter `name` by n. No-op when instrumentation is disabled."""
+    if not _enabled:
+        return
+    current_collector().count(name, n)
+
+
+def snapshot():
+    """Return a JSON-serialisable copy of the current collector's spans and counters."""
+    return current_collector().snapshot()
+
+
+def to_json(path=None, indent=2):
+    """Serialise `snapshot()` to a JSON string, optionally writing it to `path`."""
+    data = json.dumps(snapshot(), indent=indent)
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
+    return data
+
+
+def bind_session():
+    """Give the current Streamlit session its own collector. Call at the top of each page."""
+    if not _enabled:
+        return
+    import streamlit as st
+
+    if "_finwise_metrics" not in st.session_state:
+        st.session_state["_finwise_metrics"] = Collector()
+    use_collector(st.session_state["_finwise_metrics"])
+
+
+def render_debug_panel():
+    """Show this session's spans/counters in a sidebar expander. Only renders when enabled."""
+    if not _enabled:
+        return
+    import pandas as pd
+    import streamlit as st
+
+    bind_session()
+    snap = snapshot()
+    with st.sidebar.expander("🛠️ Performance debug"):
+        if snap["memory"]:
+            st.caption("Peak memory is skipped for samples that overlapped another session.")
+        if snap["spans"]:
+            spans_df = pd.DataFrame.from_dict(snap["spans"], orient="index")
+            spans_df = spans_df.sort_values("total_s", ascending=False)
+            st.dataframe(spans_df, use_container_width=True)
+        else:
+            st.caption("No spans recorded yet.")
+        if snap["counters"]:
+            st.json(snap["counters"])
+        st.download_button(
+            "Export JSON", data=to_json(), file_name="finwise_metrics.json",
+            mime="application/json",
+        )
+        if st.button("Reset metrics"):
+            reset()
+            st.rerun()
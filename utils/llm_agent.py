@@ -3,6 +3,7 @@ import os
 from openai import OpenAI
 import streamlit as st
 from dotenv import load_dotenv
+from utils.instrumentation import timed, count, span
 
 load_dotenv()
 
@@ -14,12 +15,14 @@ def get_openai_client():
         raise ValueError("Missing OPENAI_API_KEY in .env or Streamlit secrets.")
     return OpenAI(api_key=api_key)
 
-def ask_llm(query, context):
+@timed("llm.ask_llm")
+def ask_llm(query, context, client=None):
     """
     Ask the OpenAI LLM using retrieved context from RAG (user + external docs).
     Returns a natural, context-aware financial answer.
+    `client` defaults to the cached OpenAI client; benchmarks pass a stub.
     """
-    client = get_openai_client()
+    client = client or get_openai_client()
     prompt = f"""
 You are FinWise — an intelligent AI-powered personal financial advisor.
 Use the provided context (user's transactions and financial documents) to respond professionally.
@@ -37,9 +40,12 @@ Guidelines:
 - Do not repeat the context or file names in the answer.
 Answer:
 """
-    completion = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-    )
+    count("llm.calls")
+    count("llm.prompt_chars", len(prompt))
+    with span("llm.completion"):
+        completion = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+        )
     return completion.choices[0].message.content.strip()
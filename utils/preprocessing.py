@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from utils.instrumentation import timed, count
 
 DEFAULT_CATEGORIES = {
     "grocery": ["store", "supermarket", "grocer"],
@@ -9,6 +10,7 @@ DEFAULT_CATEGORIES = {
     "salary": ["salary", "payroll", "salary credit"],
 }
 
+@timed("preprocessing.load_transactions_from_csv")
 def load_transactions_from_csv(path_or_buffer):
     """
     Load transactions from a CSV and auto-detect key columns like date, amount, etc.
@@ -39,9 +41,11 @@ def load_transactions_from_csv(path_or_buffer):
         # fallback: create Amount column with zeros
         df["Amount"] = 0.0
 
+    count("preprocessing.rows_loaded", len(df))
     return df
 
 
+@timed("preprocessing.normalize_and_categorize")
 def normalize_and_categorize(df):
     """
     Cleans transaction data by ensuring standard columns:
@@ -99,4 +103,5 @@ def normalize_and_categorize(df):
 
     # --- Sort by Date ---
     df.sort_values("Date", inplace=True, ignore_index=True)
+    count("preprocessing.rows_categorized", len(df))
     return df
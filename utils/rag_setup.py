@@ -8,6 +8,7 @@ from pathlib import Path
 import pdfplumber
 import os
 import re
+from utils.instrumentation import timed, count, span
 
 EMB_MODEL_NAME = "all-MiniLM-L6-v2"
 EMB_DIM = 384
@@ -15,11 +16,15 @@ INDEX_PATH = Path("vector_index.faiss")
 META_PATH = Path("index_meta.pkl")
 
 class SimpleRAG:
-    def __init__(self, emb_model_name=EMB_MODEL_NAME):
-        @st.cache_resource(show_spinner=False)
-        def get_embedding_model(name=EMB_MODEL_NAME):
-            return SentenceTransformer(name)
-        self.model = get_embedding_model(emb_model_name)
+    def __init__(self, emb_model_name=EMB_MODEL_NAME, model=None):
+        # `model` lets callers (e.g. benchmarks) supply any object with an
+        # `encode(texts, ...)` method instead of loading the sentence transformer.
+        if model is None:
+            @st.cache_resource(show_spinner=False)
+            def get_embedding_model(name=EMB_MODEL_NAME):
+                return SentenceTransformer(name)
+            model = get_embedding_model(emb_model_name)
+        self.model = model
 
         self.index = None
         self.meta = []
@@ -30,9 +35,12 @@ class SimpleRAG:
         self.index = faiss.IndexFlatL2(EMB_DIM)
         self.meta = []
 
+    @timed("rag.embed_texts")
     def embed_texts(self, texts):
+        count("rag.texts_embedded", len(texts))
         return self.model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
 
+    @timed("rag.add_documents")
     def add_documents(self, texts, metadatas=None):
         if self.index is None:
             self.create_index()
@@ -43,19 +51,24 @@ class SimpleRAG:
             md = metadatas[i] if metadatas else {}
             md.update({"id": start_id + i, "text": t})
             self.meta.append(md)
+        count("rag.documents_indexed", len(texts))
         self.save()
 
+    @timed("rag.query")
     def query(self, q, top_k=5):
         if self.index is None or self.index.ntotal == 0:
             return []
         v = self.embed_texts([q]).astype("float32")
-        D, I = self.index.search(v, top_k)
+        with span("rag.search"):
+            D, I = self.index.search(v, top_k)
+        count("rag.queries")
         results = []
         for idx in I[0]:
             if idx < len(self.meta):
                 results.append(self.meta[idx])
         return results
 
+    @timed("rag.save")
     def save(self):
         faiss.write_index(self.index, str(INDEX_PATH))
         with open(META_PATH, "wb") as f:
@@ -66,6 +79,7 @@ class SimpleRAG:
         with open(META_PATH, "rb") as f:
             self.meta = pickle.load(f)
 
+    @timed("rag.ingest_folder")
     def ingest_folder(self, folder_path, chunk_size=500, overlap=50):
         folder = Path(folder_path)
         text_items, metas = [], []
@@ -91,6 +105,7 @@ class SimpleRAG:
             self.add_documents(text_items, metadatas=metas)
         return len(text_items)
 
+    @timed("rag.ingest_transactions")
     def ingest_transactions(self, df):
         texts, metas = [], []
         for _, r in df.iterrows():